@@ -1,7 +1,7 @@
 #version 330
 
 in vec3 in_vert;
-in vec3 in_norm;
+in ivec2 in_norm_oct;
 
 uniform mat4 mat_M;
 uniform mat4 mat_V;
@@ -13,7 +13,18 @@ out vec4 vert_pos_view;
 out vec4 vert_norm_world;
 out vec4 vert_norm_view;
 
+// Decode an octahedral encoded normal back to a unit vector.
+vec3 oct_decode(vec2 e) {
+  vec3 v = vec3(e, 1 - abs(e.x) - abs(e.y));
+  if (v.z < 0) {
+    v.xy = (1 - abs(v.yx)) *
+           vec2(v.x >= 0 ? 1 : -1, v.y >= 0 ? 1 : -1);
+  }
+  return normalize(v);
+}
+
 void main() {
+  vec3 in_norm = oct_decode(vec2(in_norm_oct) / 127.0);
   vert_pos_view = mat_MV * vec4(in_vert, 1);
   vert_norm_world = mat_M * vec4(in_norm, 0);
   vert_norm_view = mat_MV * vec4(in_norm, 0);
@@ -14,6 +14,9 @@ class AboutWindow(Window):
     def __init__(self, close_window: Callable[[], None]):
         super().__init__(close_window)
         self.config_dir = config_dir
+        # Both are constant, precompute instead of re-deriving per frame.
+        self.config_dir_str = str(config_dir)
+        self.config_dir_uri = config_dir.as_uri()
 
     def render(self, time: float, frame_time: float):
         with imgui_ctx.begin("About", True) as (expanded, opened):
@@ -26,4 +29,4 @@ class AboutWindow(Window):
             imgui.text("Config Directory:")
             imgui.same_line()
             imgui.text_link_open_url(
-                str(self.config_dir), self.config_dir.as_uri())
+                self.config_dir_str, self.config_dir_uri)
@@ -3,7 +3,7 @@ App window class.
 """
 
 import pathlib
-from typing import Deque, Dict
+from typing import Deque, Dict, List
 from collections import deque
 import argparse
 import logging
@@ -23,6 +23,15 @@ from graphicslab.settings.utils import load_settings
 logger = logging.getLogger(__name__)
 
 
+# Log level CLI argument to logging level.
+LOG_LEVELS = {
+    "INFO": logging.INFO,
+    "WARN": logging.WARN,
+    "DEBUG": logging.DEBUG,
+    "ERROR": logging.ERROR,
+}
+
+
 class GraphicsLabWindowRenderer(ModernglWindowRenderer):
     def __init__(self, window):
         super().__init__(window)
@@ -50,7 +59,9 @@ class App(WindowConfig):
     default_font_path: pathlib.Path
     default_font: imgui.ImFont
     default_font_size: float = 16
-    default_font_scale: float = 1
+    # 0 forces the font load on the first rendered frame; the atlas build
+    # is deferred out of __init__ so the window opens sooner.
+    default_font_scale: float = 0
 
     window_time: float = 0
     window_pos: tuple[int, int] = (0, 0)
@@ -61,23 +72,26 @@ class App(WindowConfig):
     dockspace: Dockspace
     # App windows.
     windows: Dict[str, Window] = {}
+    # Snapshot of windows.values() maintained on add/remove, so the render
+    # loop iterates a list directly instead of rebuilding a dict view
+    # iterator every frame.
+    windows_list: List[Window] = []
     windows_remove_queue: Deque[str] = deque()
+    # UI dirty flag and last submitted draw data. While no input arrives
+    # and no app window is open, the cached draw data is re-submitted
+    # instead of running a full ImGui frame.
+    ui_dirty: bool = True
+    last_draw_data: imgui.ImDrawData | None = None
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         # Initialize logging.
         if self.argv:
             log_level_arg: str = self.argv.log
-            if log_level_arg == "INFO":
-                self.log_level = logging.INFO
-            elif log_level_arg == "WARN":
-                self.log_level = logging.WARN
-            elif log_level_arg == "DEBUG":
-                self.log_level = logging.DEBUG
-            elif log_level_arg == "ERROR":
-                self.log_level = logging.ERROR
-            else:
+            log_level = LOG_LEVELS.get(log_level_arg)
+            if log_level is None:
                 raise ValueError(f"Log level {log_level_arg} doesn't exist.")
+            self.log_level = log_level
         logging.basicConfig(
             level=self.log_level,
             format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -102,15 +116,9 @@ class App(WindowConfig):
         logger.info("ImGui initialized.")
         # Initialize FBO stack.
         fbo_stack.push(self.wnd.fbo)
-        # Load font.
+        # Font is loaded lazily on the first frame in on_render.
         self.default_font_path = assets_path / "fonts" / \
             "JetBrainsMono" / "JetBrainsMonoNerdFont-Regular.ttf"
-        logger.info(f"Loading font from {self.default_font_path}")
-        self.default_font = self.io.fonts.add_font_from_file_ttf(
-            str(self.default_font_path),
-            self.default_font_size
-        )
-        self.imgui_renderer.refresh_font_texture()
         # Initialize dockspace.
         self.dockspace = Dockspace(
             self.wnd,
@@ -133,16 +141,22 @@ class App(WindowConfig):
         )
 
     def add_window(self, key: str, window: Window):
-        if key in self.windows:
+        # Sanity check, compiled out under python -O.
+        if __debug__ and key in self.windows:
             raise KeyError(f"Window {key} exists in the window list.")
         self.windows[key] = window
+        self.windows_list.append(window)
+        self.ui_dirty = True
 
     def remove_window(self, key: str):
-        if key not in self.windows:
+        # Sanity check, compiled out under python -O.
+        if __debug__ and key not in self.windows:
             raise KeyError(f"Window {key} doesn't exist.")
         self.windows_remove_queue.append(key)
+        self.ui_dirty = True
 
     def on_resize(self, width: int, height: int):
+        self.ui_dirty = True
         self.imgui_renderer.resize(width, height)
         # FIX: Disable render on resize for pyglet.
         self.wnd.render(self.timer.time, self.timer.time - self.window_time)
@@ -150,32 +164,44 @@ class App(WindowConfig):
 
     def on_key_event(self, key, action, modifiers):
         logger.info((key, action, modifiers))
+        self.ui_dirty = True
         self.imgui_renderer.key_event(key, action, modifiers)
 
     def on_mouse_position_event(self, x, y, dx, dy):
+        self.ui_dirty = True
         self.imgui_renderer.mouse_position_event(x, y, dx, dy)
 
     def on_mouse_drag_event(self, x, y, dx, dy):
+        self.ui_dirty = True
         self.imgui_renderer.mouse_drag_event(x, y, dx, dy)
 
     def on_mouse_scroll_event(self, x_offset, y_offset):
+        self.ui_dirty = True
         self.imgui_renderer.mouse_scroll_event(x_offset, y_offset)
 
     def on_mouse_press_event(self, x, y, button):
+        self.ui_dirty = True
         self.imgui_renderer.mouse_press_event(x, y, button)
 
     def on_mouse_release_event(self, x: int, y: int, button: int):
+        self.ui_dirty = True
         self.imgui_renderer.mouse_release_event(x, y, button)
 
     def on_unicode_char_entered(self, char):
+        self.ui_dirty = True
         self.imgui_renderer.unicode_char_entered(char)
 
     def on_render(self, time: float, frame_time: float):
         self.window_time = time
         # Handle high dpi screen.
+        # Loads the font on the first frame, and reloads it whenever the
+        # display DPI scale changes.
         font_scale = self.wnd.pixel_ratio
         if self.default_font_scale != font_scale:
-            logger.info("Display DPI scale changed detected, reloading fonts.")
+            logger.info(
+                f"Loading font from {self.default_font_path} "
+                f"at scale {font_scale}."
+            )
             self.default_font = self.io.fonts.add_font_from_file_ttf(
                 str(self.default_font_path),
                 self.default_font_size * font_scale
@@ -183,23 +209,42 @@ class App(WindowConfig):
             self.default_font.scale = 1 / font_scale
             self.default_font_scale = font_scale
             self.imgui_renderer.refresh_font_texture()
+            self.ui_dirty = True
+
+        # Idle skip: with no input since the last frame and no app window
+        # open, nothing in the UI can have changed, so re-submit the last
+        # frame's draw data instead of rebuilding it. The FPS counter keeps
+        # the dockspace animated, so it disables the skip.
+        show_fps = self.settings_state.value.interface_settings.show_fps_counter.value
+        if (
+            not self.ui_dirty
+            and not self.windows
+            and not show_fps
+            and self.last_draw_data is not None
+        ):
+            self.imgui_renderer.render(self.last_draw_data)
+            return
+        self.ui_dirty = False
 
         # ImGui render cycle start.
         imgui.new_frame()
         imgui.push_font(self.default_font)
 
-        self.windows_remove_queue = deque()
+        self.windows_remove_queue.clear()
 
         # Render Dockspace.
         self.dockspace.render(time, frame_time)
         # Render windows.
-        for window in self.windows.values():
+        for window in self.windows_list:
             window.render(time, frame_time)
 
-        for key in self.windows_remove_queue:
-            del self.windows[key]
+        if self.windows_remove_queue:
+            for key in self.windows_remove_queue:
+                del self.windows[key]
+            self.windows_list = list(self.windows.values())
 
         imgui.pop_font()
         # ImGui render cycles end.
         imgui.render()
-        self.imgui_renderer.render(imgui.get_draw_data())
+        self.last_draw_data = imgui.get_draw_data()
+        self.imgui_renderer.render(self.last_draw_data)
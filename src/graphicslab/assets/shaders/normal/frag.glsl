@@ -4,8 +4,6 @@ in vec4 vert_pos_view;
 in vec4 vert_norm_world;
 in vec4 vert_norm_view;
 
-uniform mat4 mat_P;
-
 out vec4 frag_color;
 
 void main() {
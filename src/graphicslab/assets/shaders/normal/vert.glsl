@@ -1,21 +1,35 @@
 #version 330
 
 in vec3 in_vert;
-in vec3 in_norm;
+in ivec2 in_norm_oct;
 
-uniform mat4 mat_M;
-uniform mat4 mat_V;
-uniform mat4 mat_P;
-uniform mat4 mat_MV;
-uniform mat4 mat_MVP;
+// Shared per-frame matrices, uploaded once per change into a single UBO.
+layout(std140) uniform Matrices {
+  mat4 mat_MV;
+  mat4 mat_MVP;
+  // Normal matrices precomputed on CPU (transpose of inverse).
+  mat3 mat_Normal;
+  mat3 mat_Normal_world;
+};
 
 out vec4 vert_pos_view;
 out vec4 vert_norm_world;
 out vec4 vert_norm_view;
 
+// Decode an octahedral encoded normal back to a unit vector.
+vec3 oct_decode(vec2 e) {
+  vec3 v = vec3(e, 1 - abs(e.x) - abs(e.y));
+  if (v.z < 0) {
+    v.xy = (1 - abs(v.yx)) *
+           vec2(v.x >= 0 ? 1 : -1, v.y >= 0 ? 1 : -1);
+  }
+  return normalize(v);
+}
+
 void main() {
+  vec3 in_norm = oct_decode(vec2(in_norm_oct) / 127.0);
   vert_pos_view = mat_MV * vec4(in_vert, 1);
-  vert_norm_world = mat_M * vec4(in_norm, 0);
-  vert_norm_view = mat_MV * vec4(in_norm, 0);
+  vert_norm_world = vec4(mat_Normal_world * in_norm, 0);
+  vert_norm_view = vec4(mat_Normal * in_norm, 0);
   gl_Position = mat_MVP * vec4(in_vert, 1);
 }
@@ -2,11 +2,14 @@
 
 in vec3 in_vert;
 
-uniform mat4 mat_M;
-uniform mat4 mat_V;
-uniform mat4 mat_P;
-uniform mat4 mat_MV;
-uniform mat4 mat_MVP;
+// Shared per-frame matrices, uploaded once per change into a single UBO.
+layout(std140) uniform Matrices {
+  mat4 mat_MV;
+  mat4 mat_MVP;
+  // Normal matrices precomputed on CPU (transpose of inverse).
+  mat3 mat_Normal;
+  mat3 mat_Normal_world;
+};
 
 void main() {
   vec4 proj_vert = mat_MVP * vec4(in_vert, 1);
@@ -1,5 +1,4 @@
 from typing import Dict
-import copy
 from observer.observer import Observable, Observer
 
 StatusType = str | float
@@ -31,7 +30,9 @@ class StatusObserver(Observer):
 
     def update(self, *new_state):
         new_state = new_state[0]
-        self._value = copy.deepcopy(new_state)
+        # Status values are immutable str/float, so a plain dict copy
+        # snapshots the table without deepcopy's per-entry dispatch.
+        self._value = dict(new_state)
 
     @property
     def value(self):
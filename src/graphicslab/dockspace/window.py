@@ -5,9 +5,10 @@ Dockspace window.
 from typing import Callable
 import logging
 
+from array import array
+
 from moderngl import Context
 from moderngl_window.integrations.imgui_bundle import ModernglWindowRenderer
-import numpy as np
 from moderngl_window.context.base.window import BaseWindow
 from imgui_bundle import imgui, imgui_ctx
 
@@ -50,13 +51,57 @@ class Dockspace:
     # About
     show_about: bool = False
 
+    # Constant window flags, combined once at class creation instead of
+    # re-OR-ing the enum values every frame.
+    DOCKSPACE_WINDOW_FLAGS = (imgui.WindowFlags_.no_title_bar.value |
+                              imgui.WindowFlags_.no_collapse.value |
+                              imgui.WindowFlags_.no_resize.value |
+                              imgui.WindowFlags_.no_move.value |
+                              imgui.WindowFlags_.no_bring_to_front_on_focus.value |
+                              imgui.WindowFlags_.no_nav_focus.value |
+                              imgui.WindowFlags_.no_background.value)
+    STATUS_BAR_FLAGS = (imgui.WindowFlags_.no_title_bar.value |
+                        imgui.WindowFlags_.no_collapse.value |
+                        imgui.WindowFlags_.menu_bar.value |
+                        imgui.WindowFlags_.no_resize.value |
+                        imgui.WindowFlags_.no_move.value |
+                        imgui.WindowFlags_.no_bring_to_front_on_focus.value |
+                        imgui.WindowFlags_.no_nav_focus.value |
+                        imgui.WindowFlags_.no_background.value)
+    JOBS_TABLE_FLAGS = (imgui.TableFlags_.sizing_fixed_fit.value |
+                        imgui.TableFlags_.row_bg.value |
+                        imgui.TableFlags_.borders.value |
+                        imgui.TableFlags_.resizable.value)
+
+    # Cached dockspace and status bar layout rectangles, rebuilt only when
+    # the window size or the menu bar height changes. Stored as ImVec2 so
+    # unresized frames also skip the per-call tuple to ImVec2 conversion.
+    layout_key: tuple = ()
+    dockspace_pos: imgui.ImVec2
+    dockspace_size: imgui.ImVec2
+    status_bar_pos: imgui.ImVec2
+    status_bar_size: imgui.ImVec2
+
     # Frametime buffer.
     FRAME_RATE_DSP_FREQ = 10
+    # Seconds between FPS display refreshes, precomputed so the per-frame
+    # comparison doesn't redo the division.
+    FRAME_RATE_DSP_PERIOD = 1 / FRAME_RATE_DSP_FREQ
     last_update_frame_rate = 0
     FRAME_TIME_BUF_SIZE = 32
-    frame_time_buf: np.ndarray
+    # Power-of-two size, so the ring index wraps with a bitwise and.
+    FRAME_TIME_BUF_MASK = FRAME_TIME_BUF_SIZE - 1
+    frame_time_buf: array
     frame_time_buf_idx: int
+    # Running sum over the ring buffer, updated in O(1) per frame instead
+    # of re-reducing the whole buffer.
+    frame_time_sum: float
     frame_rate: int = 0
+    # Rendered FPS string, rebuilt only when frame_rate updates.
+    fps_text: str = "0 FPS"
+    # Whether the FPS counter ran last frame, to reseed the stale ring
+    # buffer when the counter is re-enabled.
+    fps_was_on: bool = False
 
     def __init__(
         self,
@@ -81,17 +126,16 @@ class Dockspace:
         # Enable docking.
         io.config_flags |= imgui.ConfigFlags_.docking_enable.value
         # Init frametime buffer.
-        self.frame_time_buf = np.ones((self.FRAME_TIME_BUF_SIZE,))
+        self.frame_time_buf = array(
+            "d", [1.0] * self.FRAME_TIME_BUF_SIZE)
         self.frame_time_buf_idx = 0
+        self.frame_time_sum = float(self.FRAME_TIME_BUF_SIZE)
 
         # Load mesh view window.
-        def close_mesh_view():
-            self.show_mesh_viewer = False
-            self.remove_window("mesh_viewer")
         self.add_window(
             "mesh_viewer",
             MeshViewerWindow(
-                close_mesh_view,
+                self.close_mesh_viewer_window,
                 self.ctx,
                 self.imgui_renderer,
                 self.io,
@@ -104,7 +148,26 @@ class Dockspace:
     def __del__(self):
         self.settings_state.detach(self.settings_observer)
 
+    # Close callbacks handed to the managed windows. Bound methods instead
+    # of closures defined inside render, so toggling a menu item doesn't
+    # allocate a new function + cell each time.
+    def close_settings_window(self):
+        self.show_settings = False
+        self.remove_window("settings")
+
+    def close_mesh_viewer_window(self):
+        self.show_mesh_viewer = False
+        self.remove_window("mesh_viewer")
+
+    def close_about_window(self):
+        self.show_about = False
+        self.remove_window("about")
+
     def render(self, time: float, frame_time: float):
+        # Hoisted out of the status bar block: three chained attribute
+        # lookups, read once per frame.
+        show_fps = self.settings_observer.value.interface_settings.show_fps_counter.value
+
         # ------------------------- Menu Bar ------------------------- #
 
         with imgui_ctx.begin_main_menu_bar():
@@ -115,12 +178,11 @@ class Dockspace:
                 changed, self.show_settings = imgui.menu_item(
                     "Settings", "", self.show_settings)
                 if changed:
-                    def close():
-                        self.show_settings = False
-                        self.remove_window("settings")
                     if self.show_settings:
                         self.add_window(
-                            "settings", SettingsWindow(close, self.settings_state))
+                            "settings", SettingsWindow(
+                                self.close_settings_window,
+                                self.settings_state))
                     else:
                         self.remove_window("settings")
                 imgui.end_menu()
@@ -131,13 +193,10 @@ class Dockspace:
                 changed, self.show_mesh_viewer = imgui.menu_item(
                     "Mesh Viewer", "", self.show_mesh_viewer)
                 if changed:
-                    def close():
-                        self.show_mesh_viewer = False
-                        self.remove_window("mesh_viewer")
                     if self.show_mesh_viewer:
                         self.add_window(
                             "mesh_viewer", MeshViewerWindow(
-                                close,
+                                self.close_mesh_viewer_window,
                                 self.ctx,
                                 self.imgui_renderer,
                                 self.io,
@@ -158,28 +217,30 @@ class Dockspace:
             changed, self.show_about = imgui.menu_item(
                 "About", "", self.show_about)
             if changed:
-                def close():
-                    self.show_about = False
-                    self.remove_window("about")
                 if self.show_about:
-                    self.add_window("about", AboutWindow(close))
+                    self.add_window(
+                        "about", AboutWindow(self.close_about_window))
                 else:
                     self.remove_window("about")
 
         # ------------------------ Dockspace  ------------------------ #
 
+        # Hoisted: get_frame_height and the wnd.size property cross into C,
+        # read them once per frame.
         side_bar_height = imgui.get_frame_height()
-        imgui.set_next_window_pos((0, side_bar_height))
-        imgui.set_next_window_size(
-            (self.wnd.size[0], self.wnd.size[1] - 2 * side_bar_height))
-        window_flags = (imgui.WindowFlags_.no_title_bar.value |
-                        imgui.WindowFlags_.no_collapse.value |
-                        imgui.WindowFlags_.no_resize.value |
-                        imgui.WindowFlags_.no_move.value |
-                        imgui.WindowFlags_.no_bring_to_front_on_focus.value |
-                        imgui.WindowFlags_.no_nav_focus.value |
-                        imgui.WindowFlags_.no_background.value)
-        with imgui_ctx.begin("Dockspace Window", True, window_flags):
+        wnd_width, wnd_height = self.wnd.size
+        layout_key = (side_bar_height, wnd_width, wnd_height)
+        if layout_key != self.layout_key:
+            self.dockspace_pos = imgui.ImVec2(0, side_bar_height)
+            self.dockspace_size = imgui.ImVec2(
+                wnd_width, wnd_height - 2 * side_bar_height)
+            self.status_bar_pos = imgui.ImVec2(
+                0, wnd_height - side_bar_height)
+            self.status_bar_size = imgui.ImVec2(wnd_width, side_bar_height)
+            self.layout_key = layout_key
+        imgui.set_next_window_pos(self.dockspace_pos)
+        imgui.set_next_window_size(self.dockspace_size)
+        with imgui_ctx.begin("Dockspace Window", True, self.DOCKSPACE_WINDOW_FLAGS):
             # Dockspace.
             dockspace_id = imgui.get_id("Dockspace")
             # Build dock space.
@@ -207,19 +268,9 @@ class Dockspace:
 
         # ------------------------ Status Bar ------------------------ #
 
-        imgui.set_next_window_pos(
-            (0, self.wnd.size[1] - side_bar_height))
-        imgui.set_next_window_size(
-            (self.wnd.size[0], side_bar_height))
-        window_flags = (imgui.WindowFlags_.no_title_bar.value |
-                        imgui.WindowFlags_.no_collapse.value |
-                        imgui.WindowFlags_.menu_bar.value |
-                        imgui.WindowFlags_.no_resize.value |
-                        imgui.WindowFlags_.no_move.value |
-                        imgui.WindowFlags_.no_bring_to_front_on_focus.value |
-                        imgui.WindowFlags_.no_nav_focus.value |
-                        imgui.WindowFlags_.no_background.value)
-        with imgui_ctx.begin("Status Bar", True, window_flags):
+        imgui.set_next_window_pos(self.status_bar_pos)
+        imgui.set_next_window_size(self.status_bar_size)
+        with imgui_ctx.begin("Status Bar", True, self.STATUS_BAR_FLAGS):
             with imgui_ctx.begin_menu_bar():
                 # Status
                 num_jobs = len(self.status_observer.value)
@@ -230,16 +281,36 @@ class Dockspace:
                     _, self.show_status_window = imgui.menu_item(
                         f"Status: {num_jobs} jobs working", "", self.show_status_window)
                 # Frame rate.
-                if self.settings_observer.value.interface_settings.show_fps_counter.value:
-                    self.frame_time_buf[self.frame_time_buf_idx] = frame_time
+                if show_fps:
+                    if not self.fps_was_on:
+                        # Just enabled: the ring buffer holds samples from
+                        # when the counter last ran, reseed it with the
+                        # current frame time so the first readings aren't
+                        # averaged against stale data.
+                        self.frame_time_buf = array(
+                            "d", [frame_time] * self.FRAME_TIME_BUF_SIZE)
+                        self.frame_time_sum = \
+                            frame_time * self.FRAME_TIME_BUF_SIZE
+                        if frame_time > 0:
+                            self.frame_rate = int(1 / frame_time)
+                            self.fps_text = f"{self.frame_rate} FPS"
+                    idx = self.frame_time_buf_idx
+                    # Replace the evicted sample in the running sum.
+                    self.frame_time_sum += frame_time - \
+                        self.frame_time_buf[idx]
+                    self.frame_time_buf[idx] = frame_time
                     self.frame_time_buf_idx = (
-                        self.frame_time_buf_idx + 1) % self.FRAME_TIME_BUF_SIZE
-                    avg_frame_time = np.mean(self.frame_time_buf)
-                    if self.last_update_frame_rate > (1 / self.FRAME_RATE_DSP_FREQ):
+                        idx + 1) & self.FRAME_TIME_BUF_MASK
+                    # Average and format only when the displayed value
+                    # actually refreshes (FRAME_RATE_DSP_FREQ times/sec).
+                    if self.last_update_frame_rate > self.FRAME_RATE_DSP_PERIOD:
+                        avg_frame_time = self.frame_time_sum / self.FRAME_TIME_BUF_SIZE
                         self.frame_rate = int(1 / avg_frame_time)
+                        self.fps_text = f"{self.frame_rate} FPS"
                         self.last_update_frame_rate = 0
                     self.last_update_frame_rate += frame_time
-                    imgui.text(f"{self.frame_rate} FPS")
+                    imgui.text(self.fps_text)
+                self.fps_was_on = show_fps
 
         # Status window.
         if self.show_status_window:
@@ -250,13 +321,7 @@ class Dockspace:
             with imgui_ctx.begin("Running Jobs", self.show_status_window) as (expanded, opened):
                 if not opened:
                     self.show_status_window = False
-                table_flags = (
-                    imgui.TableFlags_.sizing_fixed_fit.value |
-                    imgui.TableFlags_.row_bg.value |
-                    imgui.TableFlags_.borders.value |
-                    imgui.TableFlags_.resizable.value
-                )
-                if imgui.begin_table("jobs_table", 2, table_flags):
+                if imgui.begin_table("jobs_table", 2, self.JOBS_TABLE_FLAGS):
                     imgui.table_setup_column(
                         "Job Names",
                         imgui.TableColumnFlags_.width_fixed.value,
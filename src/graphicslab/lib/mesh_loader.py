@@ -5,6 +5,7 @@ from multiprocessing import Process, Pipe
 from typing import List
 import numpy as np
 
+import meshoptimizer
 import trimesh
 from trimesh import Trimesh
 
@@ -12,6 +13,30 @@ from trimesh import Trimesh
 logger = logging.getLogger(__name__)
 
 
+# Interleaved vertex layout: 3 float32 position + octahedral encoded
+# normal in 2 signed bytes (14 bytes per vertex instead of 24).
+vertex_data_dtype = np.dtype([("in_vert", "f4", 3), ("in_norm_oct", "i1", 2)])
+
+
+def octahedral_encode(normal_arr: np.ndarray) -> np.ndarray:
+    """Octahedral encode unit normals into 2 signed bytes per normal.
+
+    Args:
+        normal_arr: (N, 3) array of unit normals.
+
+    Returns:
+        (N, 2) int8 array of octahedral encoded normals.
+    """
+    octahedral = normal_arr / np.abs(normal_arr).sum(axis=1, keepdims=True)
+    xy = octahedral[:, :2].copy()
+    # Fold the lower hemisphere over the diagonals.
+    lower = octahedral[:, 2] < 0
+    xy_lower = xy[lower]
+    xy[lower] = (1 - np.abs(xy_lower[:, ::-1])) * \
+        np.where(xy_lower >= 0, 1, -1)
+    return np.round(xy * 127).astype("i1")
+
+
 def load_proc(conn: Connection, mesh_path: str):
     logger.info(f"Loading mesh from {mesh_path}")
     try:
@@ -26,12 +51,11 @@ def load_proc(conn: Connection, mesh_path: str):
 
 class MeshLoader:
     mesh: Trimesh | None = None
-    vertex_arr: np.ndarray
-    normal_arr: np.ndarray
     index_arr: np.ndarray
-    vertex_buf: bytes
-    normal_buf: bytes
-    index_buf: bytes
+    # Interleaved (position, oct encoded normal) vertex data so the viewport
+    # only binds a single VBO per draw. Kept as a contiguous ndarray so
+    # OpenGL buffer creation can read it directly without a bytes copy.
+    vertex_data_arr: np.ndarray
     loading: bool = False
     loaded: bool = False
     mesh_loading_lock: threading.Lock = threading.Lock()
@@ -54,21 +78,39 @@ class MeshLoader:
 
         if type(mesh) is trimesh.Trimesh:
             logger.info("Loading mesh buffer into byte arrays.")
-            vertex_arr = np.array(mesh.vertices).astype("f4")
-            normal_arr = np.array(mesh.vertex_normals).astype("f4")
-            index_arr = np.array(mesh.faces).astype("u4")
-            vertex_buf = vertex_arr.tobytes()
-            normal_buf = normal_arr.tobytes()
-            index_buf = index_arr.tobytes()
+            # Single-copy dtype conversion; np.array(...).astype(...) would
+            # materialize each array twice.
+            vertex_arr = np.asarray(mesh.vertices, dtype="f4")
+            normal_arr = np.asarray(mesh.vertex_normals, dtype="f4")
+            index_arr = np.ascontiguousarray(mesh.faces, dtype="u4")
+            vertex_data_arr = np.empty(len(vertex_arr), vertex_data_dtype)
+            vertex_data_arr["in_vert"] = vertex_arr
+            vertex_data_arr["in_norm_oct"] = octahedral_encode(normal_arr)
+            logger.info("Done.")
+            logger.info("Optimizing mesh for GPU vertex cache and fetch.")
+            # Reorder triangles for post-transform cache reuse, then reorder
+            # the interleaved vertex buffer to match the new fetch order.
+            indices = np.empty(index_arr.size, dtype="u4")
+            meshoptimizer.optimize_vertex_cache(
+                indices,
+                index_arr.reshape(-1),
+                index_arr.size,
+                len(vertex_data_arr)
+            )
+            opt_vertex_data = np.empty_like(vertex_data_arr)
+            unique_vertices = meshoptimizer.optimize_vertex_fetch(
+                opt_vertex_data,
+                indices,
+                vertex_data_arr
+            )
+            vertex_data_arr = np.ascontiguousarray(
+                opt_vertex_data[:unique_vertices])
+            index_arr = indices.reshape(-1, 3)
             logger.info("Done.")
             with self.mesh_loading_lock:
                 self.mesh = mesh
-                self.vertex_arr = vertex_arr
-                self.normal_arr = normal_arr
                 self.index_arr = index_arr
-                self.vertex_buf = vertex_buf
-                self.normal_buf = normal_buf
-                self.index_buf = index_buf
+                self.vertex_data_arr = vertex_data_arr
                 self.loaded = True
         elif type(mesh) is List:
             logger.warning(
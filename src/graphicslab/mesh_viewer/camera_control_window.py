@@ -1,20 +1,25 @@
+import math
 from dataclasses import dataclass
 from typing import Callable
 
 from graphicslab.mesh_viewer.viewport import Viewport
-import numpy as np
 from imgui_bundle import imgui, imgui_ctx
 
 from graphicslab.camera import CameraMode
 from graphicslab.window import Window
 
 
+# Window size constraints, hoisted so no tuples are rebuilt every frame.
+WINDOW_SIZE_MIN = (400, 100)
+WINDOW_SIZE_MAX = (imgui.FLT_MAX, imgui.FLT_MAX)
+
+
 @dataclass
 class CameraParameters:
     # Camera position.
     rho: float = 3
-    theta: float = np.pi / 2
-    phi: float = np.pi / 4
+    theta: float = math.pi / 2
+    phi: float = math.pi / 4
     # Camera mode.
     cam_modes = [CameraMode.ORTHOGONAL, CameraMode.PERSPECTIVE]
     cam_modes_str = [str(mode) for mode in cam_modes]
@@ -54,8 +59,8 @@ class CameraControlWindow(Window):
     def render(self, time: float, frame_time: float):
         cam_states = self.cam_states
         imgui.set_next_window_size_constraints(
-            size_min=(400, 100),
-            size_max=(imgui.FLT_MAX, imgui.FLT_MAX)
+            size_min=WINDOW_SIZE_MIN,
+            size_max=WINDOW_SIZE_MAX
         )
         with imgui_ctx.begin("Mesh Viewer Camera Control", True) as (expanded, opened):
             if not opened:
@@ -85,7 +90,7 @@ class CameraControlWindow(Window):
             if changed:
                 # let theta in [-pi, pi]
                 cam_states.theta = (cam_states.theta +
-                                    np.pi) % (2 * np.pi) - np.pi
+                                    math.pi) % (2 * math.pi) - math.pi
                 self.update_view_mat()
             changed, cam_states.phi = imgui.drag_float(
                 "Camera Rotation-Z (phi)",
@@ -93,8 +98,8 @@ class CameraControlWindow(Window):
                 0.1
             )
             if changed:
-                cam_states.phi = (cam_states.phi + np.pi) % (2 * np.pi) - \
-                    np.pi  # let phi in [-pi, pi]
+                cam_states.phi = (cam_states.phi + math.pi) % (2 * math.pi) - \
+                    math.pi  # let phi in [-pi, pi]
                 self.update_view_mat()
 
             imgui.separator_text("Camera Intrinsics")
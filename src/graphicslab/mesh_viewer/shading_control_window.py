@@ -24,6 +24,11 @@ builtin_viewer_shaders = {
 logger = logging.getLogger(__name__)
 
 
+# Window size constraints, hoisted so no tuples are rebuilt every frame.
+WINDOW_SIZE_MIN = (400, 100)
+WINDOW_SIZE_MAX = (imgui.FLT_MAX, imgui.FLT_MAX)
+
+
 class ShadingControlWindow(Window):
     # Load shader callback.
     viewport: Viewport
@@ -33,8 +38,11 @@ class ShadingControlWindow(Window):
     shader_idx = 0
     # Shader paths.
     custom_vert_path: pathlib.Path | None = None
+    # Resolved path string cache to avoid filesystem access every frame.
+    custom_vert_path_str: str = "None"
     vertex_shader_file_dialog: portable_file_dialogs.open_file | None = None
     custom_frag_path: pathlib.Path | None = None
+    custom_frag_path_str: str = "None"
     fragment_shader_file_dialog: portable_file_dialogs.open_file | None = None
 
     def __init__(
@@ -68,8 +76,8 @@ class ShadingControlWindow(Window):
 
     def render(self, time: float, frame_time: float):
         imgui.set_next_window_size_constraints(
-            size_min=(400, 100),
-            size_max=(imgui.FLT_MAX, imgui.FLT_MAX)
+            size_min=WINDOW_SIZE_MIN,
+            size_max=WINDOW_SIZE_MAX
         )
         with imgui_ctx.begin("Mesh Viewer Shading Control", True) as (expanded, opened):
             if not opened:
@@ -89,11 +97,7 @@ class ShadingControlWindow(Window):
             if self.shader_idx == len(builtin_viewer_shaders):
                 imgui.push_item_width(-200)
                 # Vertex source.
-                if self.custom_vert_path is None:
-                    vert_path = "None"
-                else:
-                    vert_path = str(self.custom_vert_path.resolve())
-                imgui.input_text("##vert_path", vert_path)
+                imgui.input_text("##vert_path", self.custom_vert_path_str)
 
                 imgui.same_line()
 
@@ -111,16 +115,14 @@ class ShadingControlWindow(Window):
                         logger.info("No shader file selected.")
                     else:
                         self.custom_vert_path = pathlib.Path(file_path[0])
+                        self.custom_vert_path_str = str(
+                            self.custom_vert_path.resolve())
                         logger.info(
                             f"Selected shader file {self.custom_vert_path}.")
                     self.vertex_shader_file_dialog = None
 
                 # Fragment source.
-                if self.custom_frag_path is None:
-                    frag_path = "None"
-                else:
-                    frag_path = str(self.custom_frag_path.resolve())
-                imgui.input_text("##frag_path", frag_path)
+                imgui.input_text("##frag_path", self.custom_frag_path_str)
 
                 imgui.same_line()
 
@@ -138,6 +140,8 @@ class ShadingControlWindow(Window):
                         logger.info("No shader file selected.")
                     else:
                         self.custom_frag_path = pathlib.Path(file_path[0])
+                        self.custom_frag_path_str = str(
+                            self.custom_frag_path.resolve())
                         logger.info(
                             f"Selected shader file {self.custom_frag_path}.")
                     self.fragment_shader_file_dialog = None
@@ -1,13 +1,14 @@
 import logging
 import pathlib
-from typing import List, Tuple
+import re
+from typing import Callable, Dict, List, Tuple
 
 from graphicslab.consts import assets_path
 
 import moderngl
 import numpy as np
 import glm
-from moderngl import CULL_FACE, DEPTH_TEST, Buffer, Context, Framebuffer, Program, Renderbuffer, Texture, Uniform, VertexArray
+from moderngl import CULL_FACE, DEPTH_TEST, Buffer, Context, Framebuffer, Program, Renderbuffer, Texture, Uniform, UniformBlock, VertexArray
 from moderngl_window.integrations.imgui_bundle import ModernglWindowRenderer
 
 from graphicslab.fbo_stack import fbo_stack
@@ -22,11 +23,103 @@ wire_vert_path = assets_path / "shaders" / "wire_frame" / "vert.glsl"
 wire_frag_path = assets_path / "shaders" / "wire_frame" / "frag.glsl"
 
 
+# GL state flags for the mesh pass, combined once at import time.
+RENDER_FLAGS = DEPTH_TEST | CULL_FACE
+
+
+# Binding point and std140 size of the shared Matrices uniform block:
+# two mat4 plus two mat3 whose columns are padded to vec4.
+MATRICES_BINDING = 0
+MATRICES_UBO_SIZE = 224
+
+
+# Uniforms the viewport knows how to feed to a shader program.
+viewport_uniform_names = (
+    "mat_M",
+    "mat_V",
+    "mat_P",
+    "mat_MV",
+    "mat_MVP",
+    "mat_Normal",
+    "mat_Normal_world",
+    "wire_color",
+)
+
+
+def cache_uniforms(program: Program) -> Dict[str, Uniform]:
+    """Look up the viewport uniforms of a program once at link time.
+
+    Args:
+        program: shader program to introspect.
+
+    Returns:
+        Mapping from uniform name to the Uniform handle.
+    """
+    uniforms = {}
+    for name in viewport_uniform_names:
+        if name in program:
+            uniform = program[name]
+            if type(uniform) is Uniform:
+                uniforms[name] = uniform
+    return uniforms
+
+
+def compile_uniform_writer(program: Program) -> Callable[[Dict[str, bytes]], None]:
+    """Compile a straight-line uniform upload function for a program.
+
+    The generated function touches only the uniforms the program declares,
+    so per-frame dispatch has no name lookups and no branches besides the
+    changed-bytes check.
+
+    Args:
+        program: shader program to specialize for.
+
+    Returns:
+        Function writing a frame's uniform data mapping to the program.
+    """
+    uniforms = cache_uniforms(program)
+    cache: Dict[str, bytes] = {}
+    namespace: Dict = {"cache": cache}
+    lines = ["def write_uniforms(uniform_data):"]
+    if not uniforms:
+        lines.append("    pass")
+    for name, uniform in uniforms.items():
+        namespace[f"u_{name}"] = uniform
+        lines.append(f"    data = uniform_data['{name}']")
+        lines.append(f"    if cache.get('{name}') != data:")
+        lines.append(f"        u_{name}.write(data)")
+        lines.append(f"        cache['{name}'] = data")
+    exec("\n".join(lines), namespace)
+    return namespace["write_uniforms"]
+
+
+def pad_format(fmt: str):
+    """Convert a single buffer format node to padding of the same byte size.
+
+    Args:
+        fmt: format node, e.g. "3f" or "2i1".
+
+    Returns:
+        Padding node skipping the same number of bytes, e.g. "3x4" or "2x1".
+    """
+    match = re.fullmatch(r"(\d*)([fiu])(\d*)", fmt)
+    if match is None:
+        raise ValueError(f"Unsupported buffer format node {fmt}.")
+    count = int(match.group(1)) if match.group(1) else 1
+    size = int(match.group(3)) if match.group(3) else 4
+    return f"{count}x{size}"
+
+
 class Viewport:
     # Viewport parameters.
     size: Tuple[int, int] = (0, 0)
+    # Allocated render target size. Grows geometrically and never shrinks so
+    # a live window drag doesn't re-create GL objects dozens of times per
+    # second; the viewport renders to the lower-left sub-rect.
+    alloc_size: Tuple[int, int] = (0, 0)
     aspect: float = 1
-    clear_color = (0, 0, 0, 1)
+    # Clear color, pre-unpacked so render doesn't splat a tuple per frame.
+    clear_r, clear_g, clear_b, clear_a = 0, 0, 0, 1
 
     # OpenGL render target.
     ctx: Context
@@ -36,14 +129,28 @@ class Viewport:
 
     mesh_shader: Shader
     mesh_program: Program
-    vbo_list: List[Tuple[Buffer, str, str]]
+    # Shaders keyed by source paths, so switching back to an already seen
+    # shader keeps its Program identity and its cached VAO can hit.
+    shader_cache: Dict[Tuple[pathlib.Path, pathlib.Path], Shader]
+    vbo_list: List[Tuple[Buffer, str, Tuple[str, ...]]]
     mesh_ibo: Buffer | None = None
     mesh_vao: VertexArray
+    # VAOs keyed by program glo, so switching back to an already seen
+    # shader reuses its VAO instead of rebuilding it. Cleared on mesh load;
+    # hot reload evicts the entry of the program it replaces.
+    vao_cache: Dict[int, VertexArray]
+    # Upload function generated at link time, containing one write per
+    # uniform the program declares. Unchanged uniforms skip the GL call.
+    mesh_uniform_writer: Callable[[Dict[str, bytes]], None]
 
     # Wire frame.
     draw_wire_frame: bool = True
-    wire_color: glm.vec3 = glm.vec3(0.1, 0.1, 0.1)
+    # Wire color and its uniform bytes, converted on assignment instead of
+    # every frame.
+    wire_color_value: glm.vec3 = glm.vec3(0.1, 0.1, 0.1)
+    wire_color_bytes: bytes = wire_color_value.to_bytes()
     wire_program: Program
+    wire_uniform_writer: Callable[[Dict[str, bytes]], None]
     wire_ibo: Buffer | None = None
     wire_vao: VertexArray
 
@@ -51,9 +158,28 @@ class Viewport:
     model_mat = glm.identity(glm.mat4x4)
     view_mat = glm.identity(glm.mat4x4)
     perspective_mat = glm.identity(glm.mat4x4)
+    # Numpy mirrors of the matrices (math convention, row i is matrix row i)
+    # and scratch matrices for the per-frame products, so rendering a frame
+    # allocates no new matrix objects.
+    model_np: np.ndarray
+    view_np: np.ndarray
+    persp_np: np.ndarray
+    mv_np: np.ndarray
+    mvp_np: np.ndarray
+    # Matrix-derived uniform data, rebuilt only when a matrix changed.
+    mats_dirty: bool = True
+    uniform_data: Dict[str, bytes]
+    # Shared UBO backing the Matrices block of the builtin shaders, so all
+    # matrix uniforms upload as one buffer write. Custom shaders using
+    # plain uniforms still go through the generated writers.
+    matrices_ubo: Buffer
+    ubo_np: np.ndarray
 
     def __init__(self, ctx: Context) -> None:
         self.ctx = ctx
+        # The depth comparison never changes, set it once here.
+        self.ctx.depth_func = "<="
+        self.alloc_size = (1, 1)
         self.render_texture = self.ctx.texture((1, 1), 3)
         self.depth_buffer = self.ctx.depth_renderbuffer((1, 1))
         self.fbo = self.ctx.framebuffer(
@@ -61,12 +187,25 @@ class Viewport:
             depth_attachment=self.depth_buffer
         )
         self.vbo_list = []
+        self.shader_cache = {}
+        self.vao_cache = {}
+        self.model_np = np.array(self.model_mat, dtype="f4")
+        self.view_np = np.array(self.view_mat, dtype="f4")
+        self.persp_np = np.array(self.perspective_mat, dtype="f4")
+        self.mv_np = np.empty((4, 4), dtype="f4")
+        self.mvp_np = np.empty((4, 4), dtype="f4")
+        # One vec4 per row; zeros keep the mat3 column padding cleared.
+        self.ubo_np = np.zeros((MATRICES_UBO_SIZE // 16, 4), dtype="f4")
+        self.matrices_ubo = self.ctx.buffer(reserve=MATRICES_UBO_SIZE)
+        self.matrices_ubo.bind_to_uniform_block(MATRICES_BINDING)
         wire_vert_src = wire_vert_path.read_text()
         wire_frag_src = wire_frag_path.read_text()
         self.wire_program = self.ctx.program(
             vertex_shader=wire_vert_src,
             fragment_shader=wire_frag_src
         )
+        self.wire_uniform_writer = compile_uniform_writer(self.wire_program)
+        self.bind_matrices_block(self.wire_program)
 
     def load_shader(self, vert_path: pathlib.Path, frag_path: pathlib.Path):
         """
@@ -76,19 +215,31 @@ class Viewport:
             vert_path: path to vertext shader.
             frag_path: path to fragment shader.
         """
-        self.mesh_shader = Shader(
-            self.ctx,
-            vert_path,
-            frag_path
-        )
+        key = (vert_path, frag_path)
+        shader = self.shader_cache.get(key)
+        if shader is None:
+            shader = Shader(
+                self.ctx,
+                vert_path,
+                frag_path
+            )
+            self.shader_cache[key] = shader
+        self.mesh_shader = shader
         self.mesh_program = self.mesh_shader.program
+        self.mesh_uniform_writer = compile_uniform_writer(self.mesh_program)
+        self.bind_matrices_block(self.mesh_program)
         logger.info(f"Shader loaded from {vert_path} and {frag_path}")
         self.assemble_vao()
 
     def update_shader(self):
         if not self.mesh_shader.reload_shader():
             return False
+        # The recompiled program replaces the old one; drop the VAO still
+        # pinning it so both can be garbage collected.
+        self.vao_cache.pop(self.mesh_program.glo, None)
         self.mesh_program = self.mesh_shader.program
+        self.mesh_uniform_writer = compile_uniform_writer(self.mesh_program)
+        self.bind_matrices_block(self.mesh_program)
         self.assemble_vao()
         return True
 
@@ -103,22 +254,18 @@ class Viewport:
         """
         if not mesh_loader.is_loaded():
             return False
-        self.vbo_list = []
-        self.vbo_list.append(
+        # Interleaved position + oct encoded normal in a single VBO so each
+        # draw only binds one buffer and both attributes of a vertex share a
+        # cache line. The contiguous ndarrays are passed to ctx.buffer
+        # directly through the buffer protocol, skipping a bytes copy.
+        self.vbo_list = [
             (
-                self.ctx.buffer(mesh_loader.vertex_buf),
-                "3f",
-                "in_vert"
+                self.ctx.buffer(mesh_loader.vertex_data_arr),
+                "3f 2i1",
+                ("in_vert", "in_norm_oct")
             )
-        )
-        self.vbo_list.append(
-            (
-                self.ctx.buffer(mesh_loader.normal_buf),
-                "3f",
-                "in_norm"
-            )
-        )
-        self.mesh_ibo = self.ctx.buffer(mesh_loader.index_buf)
+        ]
+        self.mesh_ibo = self.ctx.buffer(mesh_loader.index_arr)
         index_arr = mesh_loader.index_arr
         wire_arr = np.hstack(
             (
@@ -129,52 +276,122 @@ class Viewport:
         ).T
         wire_arr.sort(axis=1)
         wire_arr = np.unique(wire_arr, axis=0)
-        self.wire_ibo = self.ctx.buffer(wire_arr.tobytes())
+        self.wire_ibo = self.ctx.buffer(np.ascontiguousarray(wire_arr))
+        # Cached VAOs reference the old mesh buffers.
+        self.vao_cache.clear()
         self.assemble_vao()
         return True
 
+    def program_content(self, program: Program):
+        """Build VAO content for a program, padding attributes it doesn't use.
+
+        Args:
+            program: target shader program.
+
+        Returns:
+            VAO content list for ctx.vertex_array.
+        """
+        content = []
+        for vbo, buf_fmt, in_params in self.vbo_list:
+            used_fmt = []
+            used_params = []
+            for fmt, in_param in zip(buf_fmt.split(), in_params):
+                if in_param in program:
+                    used_fmt.append(fmt)
+                    used_params.append(in_param)
+                else:
+                    used_fmt.append(pad_format(fmt))
+            if used_params:
+                content.append((vbo, " ".join(used_fmt), *used_params))
+        return content
+
+    def bind_matrices_block(self, program: Program):
+        """Bind a program's Matrices uniform block to the shared UBO.
+
+        Args:
+            program: shader program to bind.
+        """
+        if "Matrices" in program:
+            block = program["Matrices"]
+            if type(block) is UniformBlock:
+                block.binding = MATRICES_BINDING
+
+    def cached_vao(self, program: Program, index_buffer: Buffer | None):
+        """Look up the VAO for a program, assembling it on the first use.
+
+        Args:
+            program: shader program the VAO binds to.
+            index_buffer: index buffer of the VAO.
+
+        Returns:
+            The cached or newly assembled VertexArray.
+        """
+        vao = self.vao_cache.get(program.glo)
+        if vao is None:
+            content_buf = self.program_content(program)
+            vao = self.ctx.vertex_array(
+                program,
+                content_buf,
+                index_buffer=index_buffer
+            )
+            self.vao_cache[program.glo] = vao
+            logger.info(f"VAO assembled with {len(content_buf)} buffers.")
+        return vao
+
     def assemble_vao(self):
         """Assemble VAO using shader, VBO, and IBO"""
-        mesh_content_buf = []
-        for vbo, buf_fmt, in_param in self.vbo_list:
-            if in_param in self.mesh_program:
-                mesh_content_buf.append((vbo, buf_fmt, in_param))
-        self.mesh_vao = self.ctx.vertex_array(
-            self.mesh_program,
-            mesh_content_buf,
-            index_buffer=self.mesh_ibo
-        )
-        logger.info(f"Mesh VAO updated with {len(mesh_content_buf)} buffers.")
-        wire_content_buf = []
-        for vbo, buf_fmt, in_param in self.vbo_list:
-            if in_param in self.wire_program:
-                wire_content_buf.append((vbo, buf_fmt, in_param))
-        self.wire_vao = self.ctx.vertex_array(
-            self.wire_program,
-            wire_content_buf,
-            index_buffer=self.wire_ibo
-        )
+        self.mesh_vao = self.cached_vao(self.mesh_program, self.mesh_ibo)
+        self.wire_vao = self.cached_vao(self.wire_program, self.wire_ibo)
 
     def resize(self, w: int, h: int):
+        """Resize the viewport, reusing the render target when it still fits.
+
+        Args:
+            w: new viewport width.
+            h: new viewport height.
+
+        Returns:
+            True if the render texture was re-allocated.
+        """
         self.size = (w, h)
         self.aspect = w / h
-        self.render_texture = self.ctx.texture((w, h), 3)
-        self.depth_buffer = self.ctx.depth_renderbuffer((w, h))
+        alloc_w, alloc_h = self.alloc_size
+        if w <= alloc_w and h <= alloc_h:
+            # Render target still large enough, just render to the sub-rect.
+            self.fbo.viewport = (0, 0, w, h)
+            return False
+        # Round capacity up to the next power of two so a growing viewport
+        # settles into a stable allocation after a few steps.
+        alloc_w = 1 << (max(w, alloc_w) - 1).bit_length()
+        alloc_h = 1 << (max(h, alloc_h) - 1).bit_length()
+        self.alloc_size = (alloc_w, alloc_h)
+        self.render_texture = self.ctx.texture((alloc_w, alloc_h), 3)
+        self.depth_buffer = self.ctx.depth_renderbuffer((alloc_w, alloc_h))
         self.fbo = self.ctx.framebuffer(
             color_attachments=[self.render_texture],
             depth_attachment=self.depth_buffer
         )
+        self.fbo.viewport = (0, 0, w, h)
+        return True
 
-    def update_view_mat(self, cam_pos: glm.vec3, cam_rot: glm.quat):
+    @property
+    def wire_color(self) -> glm.vec3:
+        return self.wire_color_value
+
+    @wire_color.setter
+    def wire_color(self, color: glm.vec3):
+        self.wire_color_value = color
+        self.wire_color_bytes = color.to_bytes()
+
+    def update_view_mat(self, view_mat: glm.mat4x4):
         """Update camera extrinsic (view matrix).
 
         Args:
-            cam_pos: glm.vec3 position.
-            cam_rot: glm.quat rotation.
+            view_mat: world to camera transform matrix.
         """
-        # Camera to world transform matrix.
-        cam_mat = glm.translate(cam_pos) @ glm.mat4_cast(cam_rot)
-        self.view_mat = glm.inverse(cam_mat)
+        self.view_mat = view_mat
+        self.view_np[:] = view_mat
+        self.mats_dirty = True
 
     def update_orthogonal_mat(self, scale: float, near: float, far: float):
         """Update camera intrinsic (perspective matrix)."""
@@ -192,6 +409,8 @@ class Viewport:
             near,
             far
         )
+        self.persp_np[:] = self.perspective_mat
+        self.mats_dirty = True
 
     def update_perspective_mat(self, fov: float, near: float, far: float):
         """Update camera intrinsic (perspective matrix)."""
@@ -202,6 +421,8 @@ class Viewport:
             near,
             far
         )
+        self.persp_np[:] = self.perspective_mat
+        self.mats_dirty = True
 
     def render(self, time: float, frame_time: float):
         """Rendering function for the viewport. The result will be rendered to the render_texture.
@@ -213,63 +434,52 @@ class Viewport:
         fbo_stack.push(self.fbo)
 
         # Clear screen.
-        self.fbo.clear(*self.clear_color, depth=1)
-        # Enabled depth test.
-        self.ctx.enable_only(DEPTH_TEST | CULL_FACE)
-        self.ctx.depth_func = "<="
-
-        # Calculate uniforms.
-        mat_M = self.model_mat
-        mat_V = self.view_mat
-        mat_P = self.perspective_mat
-        mat_MV = mat_V @ mat_M
-        mat_MVP = mat_P @ mat_MV
-        # Write mesh program unifroms.
-        if "mat_M" in self.mesh_program:
-            uniform_mat_M = self.mesh_program["mat_M"]
-            if type(uniform_mat_M) is Uniform:
-                uniform_mat_M.write(mat_M.to_bytes())
-        if "mat_V" in self.mesh_program:
-            uniform_mat_V = self.mesh_program["mat_V"]
-            if type(uniform_mat_V) is Uniform:
-                uniform_mat_V.write(mat_V.to_bytes())
-        if "mat_P" in self.mesh_program:
-            uniform_mat_P = self.mesh_program["mat_P"]
-            if type(uniform_mat_P) is Uniform:
-                uniform_mat_P.write(mat_P.to_bytes())
-        if "mat_MV" in self.mesh_program:
-            uniform_mat_MV = self.mesh_program["mat_MV"]
-            if type(uniform_mat_MV) is Uniform:
-                uniform_mat_MV.write(mat_MV.to_bytes())
-        if "mat_MVP" in self.mesh_program:
-            uniform_mat_MVP = self.mesh_program["mat_MVP"]
-            if type(uniform_mat_MVP) is Uniform:
-                uniform_mat_MVP.write(mat_MVP.to_bytes())
+        self.fbo.clear(
+            self.clear_r, self.clear_g, self.clear_b, self.clear_a, depth=1)
+        # Enabled depth test. enable_only has to stay per frame: the ImGui
+        # pass mutates the GL enable state on every frame.
+        self.ctx.enable_only(RENDER_FLAGS)
+
+        # Calculate uniforms only when a matrix changed since the last
+        # frame; with a stationary camera this whole block is skipped.
+        if self.mats_dirty:
+            # matmul into the scratch matrices, so the per-frame products
+            # allocate no new matrix objects. GL column-major bytes come
+            # from the transposed views.
+            np.matmul(self.view_np, self.model_np, out=self.mv_np)
+            np.matmul(self.persp_np, self.mv_np, out=self.mvp_np)
+            # Normal matrices computed once on CPU instead of per vertex on
+            # GPU. Plain inverse: its row-major bytes are already the
+            # column-major inverse transpose.
+            mat_normal = np.linalg.inv(self.mv_np[:3, :3])
+            mat_normal_world = np.linalg.inv(self.model_np[:3, :3])
+            self.uniform_data = {
+                "mat_M": self.model_np.T.tobytes(),
+                "mat_V": self.view_np.T.tobytes(),
+                "mat_P": self.persp_np.T.tobytes(),
+                "mat_MV": self.mv_np.T.tobytes(),
+                "mat_MVP": self.mvp_np.T.tobytes(),
+                "mat_Normal": mat_normal.tobytes(),
+                "mat_Normal_world": mat_normal_world.tobytes(),
+            }
+            # Pack the std140 Matrices block and upload it in one buffer
+            # write: mat4 columns first, then the mat3 columns each padded
+            # to a vec4.
+            ubo = self.ubo_np
+            ubo[0:4] = self.mv_np.T
+            ubo[4:8] = self.mvp_np.T
+            ubo[8:11, :3] = mat_normal
+            ubo[11:14, :3] = mat_normal_world
+            self.matrices_ubo.write(ubo)
+            self.mats_dirty = False
+        uniform_data = self.uniform_data
+        # wire_color bytes are cached on assignment; the changed-bytes check
+        # in the writers skips the GL write when the color is unchanged.
+        uniform_data["wire_color"] = self.wire_color_bytes
+        # Write mesh program uniforms.
+        self.mesh_uniform_writer(uniform_data)
         # Write wire frame uniforms.
-        if "mat_M" in self.wire_program:
-            uniform_mat_M = self.wire_program["mat_M"]
-            if type(uniform_mat_M) is Uniform:
-                uniform_mat_M.write(mat_M.to_bytes())
-        if "mat_V" in self.wire_program:
-            uniform_mat_V = self.wire_program["mat_V"]
-            if type(uniform_mat_V) is Uniform:
-                uniform_mat_V.write(mat_V.to_bytes())
-        if "mat_P" in self.wire_program:
-            uniform_mat_P = self.wire_program["mat_P"]
-            if type(uniform_mat_P) is Uniform:
-                uniform_mat_P.write(mat_P.to_bytes())
-        if "mat_MV" in self.wire_program:
-            uniform_mat_MV = self.wire_program["mat_MV"]
-            if type(uniform_mat_MV) is Uniform:
-                uniform_mat_MV.write(mat_MV.to_bytes())
-        if "mat_MVP" in self.wire_program:
-            uniform_mat_MVP = self.wire_program["mat_MVP"]
-            if type(uniform_mat_MVP) is Uniform:
-                uniform_mat_MVP.write(mat_MVP.to_bytes())
-        if "wire_color" in self.wire_program:
-            uniform_wire_color = self.wire_program["wire_color"]
-            if type(uniform_wire_color) is Uniform:
-                uniform_wire_color.write(self.wire_color.to_bytes())
+        self.wire_uniform_writer(uniform_data)
 
         # Render mesh.
         if len(self.vbo_list) > 0:
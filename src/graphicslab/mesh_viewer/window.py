@@ -1,6 +1,7 @@
 from dataclasses import dataclass
+import math
 import threading
-from typing import Callable, List, Tuple
+from typing import Callable
 
 import pathlib
 import logging
@@ -9,7 +10,6 @@ from graphicslab.mesh_viewer.camera_control_window import CameraControlWindow, C
 from graphicslab.mesh_viewer.shading_control_window import ShadingControlWindow
 from imgui_bundle import imgui, imgui_ctx, portable_file_dialogs
 from moderngl_window.integrations.imgui_bundle import ModernglWindowRenderer
-import numpy as np
 
 import moderngl
 from graphicslab.camera import CameraMode
@@ -24,6 +24,18 @@ from graphicslab.fbo_stack import fbo_stack
 logger = logging.getLogger(__name__)
 
 
+# Window size constraints, hoisted so no tuples are rebuilt every frame.
+WINDOW_SIZE_MIN = (480, 270)
+WINDOW_SIZE_MAX = (imgui.FLT_MAX, imgui.FLT_MAX)
+
+TWO_PI = 2 * math.pi
+
+
+def wrap_angle(angle: float):
+    """Wrap an angle to [-pi, pi]."""
+    return (angle + math.pi) % TWO_PI - math.pi
+
+
 class MeshViewerWindow(Window):
     # Internal states.
     ctx: moderngl.Context
@@ -35,8 +47,22 @@ class MeshViewerWindow(Window):
 
     # Camera states.
     cam_states: CameraParameters = CameraParameters()
+    # Dirty flags for lazy viewport matrix updates. Multiple camera events
+    # in one frame collapse to a single recompute before the viewport renders.
+    view_mat_dirty: bool = True
+    projection_mat_dirty: bool = True
     # Viewport.
     viewport: Viewport
+    # UV coordinates cropping the viewport sub-rect out of the (possibly
+    # larger) render texture, recomputed on resize instead of per frame.
+    viewport_uv0: tuple[float, float] = (0, 1)
+    viewport_uv1: tuple[float, float] = (1, 0)
+    # Debounce for render target growth: a size exceeding the current
+    # allocation is applied only after staying stable for a moment, so a
+    # live window drag doesn't re-create GL objects every frame.
+    RESIZE_DEBOUNCE_TIME = 0.1
+    pending_resize: tuple[int, int] | None = None
+    pending_resize_time: float = 0
     # Camera control window.
     camera_control: CameraControlWindow
     # Shading control window.
@@ -106,41 +132,54 @@ class MeshViewerWindow(Window):
 
     def resize_view_port(self, w: int, h: int):
         """Resize the viewport texture base on the new viewport size."""
-        self.imgui_renderer.remove_texture(self.viewport.render_texture)
-        self.viewport.resize(w, h)
-        self.imgui_renderer.register_texture(self.viewport.render_texture)
+        old_texture = self.viewport.render_texture
+        if self.viewport.resize(w, h):
+            # Only re-register when the render texture was re-allocated.
+            self.imgui_renderer.remove_texture(old_texture)
+            self.imgui_renderer.register_texture(self.viewport.render_texture)
+        # Sample only the sub-rect of the render texture the viewport
+        # actually renders to.
+        alloc_w, alloc_h = self.viewport.alloc_size
+        self.viewport_uv0 = (0, h / alloc_h)
+        self.viewport_uv1 = (w / alloc_w, 0)
+
+    def update_view_mat(self):
+        """Mark the view matrix dirty, recomputed before the next viewport render."""
+        self.view_mat_dirty = True
+
+    def update_projection_mat(self):
+        """Mark the projection matrix dirty, recomputed before the next viewport render."""
+        self.projection_mat_dirty = True
 
-    def get_cam_transform(self):
-        """Get camera postion and rotation based on current camera parameters.
-
-        Returns:
-            cam_pos: glm.vec3 position.
-            cam_rot: glm.quat rotation.
-        """
-        # Polar coordinate to cartesian coordinate.
-        x = self.cam_states.rho * \
-            np.sin(self.cam_states.phi) * np.cos(self.cam_states.theta)
-        y = self.cam_states.rho * \
-            np.sin(self.cam_states.phi) * np.sin(self.cam_states.theta)
-        z = self.cam_states.rho * np.cos(self.cam_states.phi)
+    def ensure_view_mat(self):
+        """Update camera extrinsic (view matrix) if camera parameters changed."""
+        if not self.view_mat_dirty:
+            return
+        # Polar coordinate to cartesian coordinate. math.sin/cos avoid the
+        # NumPy scalar ufunc dispatch overhead on this hot path.
+        sin_phi = math.sin(self.cam_states.phi)
+        cos_phi = math.cos(self.cam_states.phi)
+        sin_theta = math.sin(self.cam_states.theta)
+        cos_theta = math.cos(self.cam_states.theta)
+        x = self.cam_states.rho * sin_phi * cos_theta
+        y = self.cam_states.rho * sin_phi * sin_theta
+        z = self.cam_states.rho * cos_phi
         cam_pos = glm.vec3(x, y, z)
 
         cam_center = glm.vec3(0, 0, 0)
-        world_up = glm.vec3(0, 0, 1)
-        cam_forward_xy = glm.vec3(-np.cos(self.cam_states.theta), -
-                                  np.sin(self.cam_states.theta), 0)
-        cam_right = glm.cross(cam_forward_xy, world_up)
-        cam_up = glm.rotate(cam_forward_xy, self.cam_states.phi, cam_right)
-        cam_dir = cam_center - cam_pos
-        cam_dir = cam_dir / glm.length(cam_dir)
-        cam_rot = glm.quatLookAt(cam_dir, cam_up)
-        return cam_pos, cam_rot
+        # Closed-form camera up from the spherical angles: equal to rotating
+        # the horizontal forward direction by phi around the right axis, but
+        # without the cross product and axis-angle rotation.
+        cam_up = glm.vec3(-cos_phi * cos_theta, -cos_phi * sin_theta, sin_phi)
+        # glm.lookAt builds the view matrix directly, skipping the quaternion
+        # round trip and the general 4x4 inverse.
+        self.viewport.update_view_mat(glm.lookAt(cam_pos, cam_center, cam_up))
+        self.view_mat_dirty = False
 
-    def update_view_mat(self):
-        self.viewport.update_view_mat(*self.get_cam_transform())
-
-    def update_projection_mat(self):
-        """Update camera intrinsic (perspective matrix)."""
+    def ensure_projection_mat(self):
+        """Update camera intrinsic (perspective matrix) if camera parameters changed."""
+        if not self.projection_mat_dirty:
+            return
         if self.cam_states.cam_modes[self.cam_states.cam_mode_idx] == CameraMode.ORTHOGONAL:
             self.viewport.update_orthogonal_mat(
                 self.cam_states.cam_orth_scale,
@@ -155,6 +194,7 @@ class MeshViewerWindow(Window):
             )
         else:
             logger.error("Camera mode not supported yet.")
+        self.projection_mat_dirty = False
 
     def load_mesh(self):
         """Load mesh to CPU when a new mesh file is selected."""
@@ -179,67 +219,59 @@ class MeshViewerWindow(Window):
     def viewport_control(self):
         """Viewport camera control."""
         cam_states = self.cam_states
-        mouse_sensitivity = self.settings_observer.value.interface_settings.viewport_mouse_sensitivity.value
+        # Hoist the nested settings lookups out of the per-event branches.
+        interface_settings = self.settings_observer.value.interface_settings
+        mouse_sensitivity = interface_settings.viewport_mouse_sensitivity.value
         scroll_sensitivity = self.camera_control.zoom_sensitivity
-        if self.settings_observer.value.interface_settings.revert_zoom.value:
+        if interface_settings.revert_zoom.value:
             scroll_sensitivity = -scroll_sensitivity
         mouse_delta = self.io.mouse_delta
-        if self.settings_observer.value.interface_settings.use_trackpad.value:
+        if interface_settings.use_trackpad.value:
             # Trackpad camera control.
             scroll_x = self.io.mouse_wheel_h
             scroll_y = self.io.mouse_wheel
             # If shift is not held, move camera.
             if not imgui.is_key_down(imgui.Key.left_ctrl):
-                cam_states.theta -= scroll_x / 100 * mouse_sensitivity
-                cam_states.theta = (
-                    cam_states.theta + np.pi) % (2 * np.pi) - np.pi
-                cam_states.phi -= scroll_y / 100 * mouse_sensitivity
-                cam_states.phi = (cam_states.phi + np.pi) % (2 * np.pi) - \
-                    np.pi  # let phi in [-pi, pi]
-                self.viewport.update_view_mat(
-                    *self.get_cam_transform())
+                cam_states.theta = wrap_angle(
+                    cam_states.theta - scroll_x / 100 * mouse_sensitivity)
+                cam_states.phi = wrap_angle(
+                    cam_states.phi - scroll_y / 100 * mouse_sensitivity)
+                self.update_view_mat()
             else:
                 if cam_states.cam_modes[cam_states.cam_mode_idx] == CameraMode.PERSPECTIVE:
                     cam_states.rho -= scroll_y / 100 * \
                         abs(cam_states.rho) * scroll_sensitivity
-                    cam_states.rho = glm.vec1(
-                        glm.clamp(cam_states.rho, 1.0, 20.0)).x
+                    cam_states.rho = max(1.0, min(20.0, cam_states.rho))
                 elif cam_states.cam_modes[cam_states.cam_mode_idx] == CameraMode.ORTHOGONAL:
                     cam_states.cam_orth_scale -= scroll_y / 100 * \
                         abs(cam_states.cam_orth_scale) * \
                         scroll_sensitivity
-                    cam_states.cam_orth_scale = glm.vec1(
-                        glm.clamp(cam_states.cam_orth_scale, 1, 20)).x
-                self.viewport.update_view_mat(
-                    *self.get_cam_transform())
+                    cam_states.cam_orth_scale = max(
+                        1.0, min(20.0, cam_states.cam_orth_scale))
+                self.update_view_mat()
                 self.update_projection_mat()
         else:
             # Move camera with middle mouse.
             if imgui.is_key_down(imgui.Key.mouse_middle):
-                cam_states.theta -= mouse_delta.x / 100 * mouse_sensitivity
-                cam_states.theta = (
-                    cam_states.theta + np.pi) % (2 * np.pi) - np.pi
-                cam_states.phi -= mouse_delta.y / 100 * mouse_sensitivity
-                cam_states.phi = (cam_states.phi + np.pi) % (2 * np.pi) - \
-                    np.pi  # let phi in [-pi, pi]
-                self.viewport.update_view_mat(
-                    *self.get_cam_transform())
+                cam_states.theta = wrap_angle(
+                    cam_states.theta - mouse_delta.x / 100 * mouse_sensitivity)
+                cam_states.phi = wrap_angle(
+                    cam_states.phi - mouse_delta.y / 100 * mouse_sensitivity)
+                self.update_view_mat()
             # Zoom camera with scroll wheel
             scroll = self.io.mouse_wheel
             if scroll != 0:
                 if cam_states.cam_modes[cam_states.cam_mode_idx] == CameraMode.PERSPECTIVE:
                     cam_states.rho -= scroll / 100 * \
                         abs(cam_states.rho) * scroll_sensitivity
-                    cam_states.rho = glm.vec1(
-                        glm.clamp(cam_states.rho, 1.0, 20.0)).x
+                    cam_states.rho = max(1.0, min(20.0, cam_states.rho))
                 elif cam_states.cam_modes[cam_states.cam_mode_idx] == CameraMode.ORTHOGONAL:
                     cam_states.cam_orth_scale -= scroll / 100 * \
                         abs(cam_states.cam_orth_scale) * \
                         scroll_sensitivity
-                    cam_states.cam_orth_scale = glm.vec1(
-                        glm.clamp(cam_states.cam_orth_scale, 1, 20)).x
-                self.viewport.update_view_mat(
-                    *self.get_cam_transform())
+                    cam_states.cam_orth_scale = max(
+                        1.0, min(20.0, cam_states.cam_orth_scale))
+                self.update_view_mat()
                 self.update_projection_mat()
 
     def render(self, time: float, frame_time: float):
@@ -261,13 +293,17 @@ class MeshViewerWindow(Window):
 
         # Mesh viewer main window.
         imgui.set_next_window_size_constraints(
-            size_min=(480, 270),
-            size_max=(imgui.FLT_MAX, imgui.FLT_MAX)
+            size_min=WINDOW_SIZE_MIN,
+            size_max=WINDOW_SIZE_MAX
         )
         window_flags = imgui.WindowFlags_.menu_bar.value
         with imgui_ctx.begin("Mesh Viewer", True, window_flags) as (expanded, opened):
             if not opened:
                 self.close_window()
+            # Collapsed: ImGui draws nothing, so skip the menu bar and the
+            # whole GL viewport pass (FBO bind + clear + draw).
+            if not expanded:
+                return
 
             # Mesh viewer menu.
             with imgui_ctx.begin_menu_bar():
@@ -290,17 +326,41 @@ class MeshViewerWindow(Window):
             # Viewport size.
             x, y = imgui.get_cursor_pos()
             w, h = imgui.get_content_region_avail()
+            if w <= 0 or h <= 0:
+                return
             new_viewport_size = (int(w), int(h))
-            if w > 0 and h > 0 and self.viewport.size != new_viewport_size:
-                self.resize_view_port(int(w), int(h))
-                self.update_projection_mat()
+            if self.viewport.size != new_viewport_size:
+                alloc_w, alloc_h = self.viewport.alloc_size
+                if (new_viewport_size[0] <= alloc_w
+                        and new_viewport_size[1] <= alloc_h) \
+                        or self.viewport.size == (0, 0):
+                    # Fits the current allocation: resizing only updates
+                    # the FBO rect and UVs, apply immediately. The first
+                    # real size also applies immediately — debouncing it
+                    # would stretch the initial 1x1 texture across the
+                    # pane for a few frames.
+                    self.resize_view_port(*new_viewport_size)
+                    self.update_projection_mat()
+                    self.pending_resize = None
+                elif self.pending_resize != new_viewport_size:
+                    # Growing re-creates the texture and FBO; wait until
+                    # the size stops changing.
+                    self.pending_resize = new_viewport_size
+                    self.pending_resize_time = time
+                elif time - self.pending_resize_time > self.RESIZE_DEBOUNCE_TIME:
+                    self.resize_view_port(*new_viewport_size)
+                    self.update_projection_mat()
+                    self.pending_resize = None
+            self.ensure_view_mat()
+            self.ensure_projection_mat()
             self.viewport.render(time, frame_time)
-            # Viewport drawing.
+            # Viewport drawing, cropped to the rendered sub-rect by the
+            # cached UV coordinates.
             imgui.image(
                 self.viewport.render_texture.glo,
                 (w, h),
-                (0, 1),
-                (1, 0)
+                self.viewport_uv0,
+                self.viewport_uv1
             )
             # Viewport interaction.
             imgui.set_cursor_pos((x, y))
@@ -1,7 +1,6 @@
 from dataclasses import dataclass
 from dataclasses_json import DataClassJsonMixin, config
 from dataclasses import field
-import copy
 
 from imgui_bundle import imgui
 
@@ -9,7 +8,10 @@ from observer.observer import Observable, Observer
 from graphicslab.settings.decorator import settings_field, SettingsField, FieldStyle
 
 
-@dataclass
+# The settings containers are read-only at runtime (only the SettingsField
+# leaves are edited, and saves publish freshly built objects), so they are
+# frozen with slots for cheaper attribute access and smaller instances.
+@dataclass(slots=True, frozen=True)
 class InterfaceSettings(DataClassJsonMixin):
     disp_name: str = "Interface Settings"
     show_fps_counter: SettingsField[bool] = settings_field(
@@ -34,7 +36,7 @@ class InterfaceSettings(DataClassJsonMixin):
     )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ExampleSettings(DataClassJsonMixin):
     disp_name: str = "Example Settings"
     int_input_field: SettingsField[int] = settings_field(
@@ -70,7 +72,7 @@ class ExampleSettings(DataClassJsonMixin):
     bool_field: SettingsField[bool] = settings_field(False, "Boolean Field")
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Settings(DataClassJsonMixin):
     interface_settings: InterfaceSettings = field(
         default_factory=lambda: InterfaceSettings()
@@ -100,11 +102,15 @@ class SettingsObserver(Observer):
         super(SettingsObserver, self).__init__(name)
         self._value = Settings()
 
-    def update(self, *new_state):
-        new_state = new_state[0]
-        if type(new_state) is not Settings:
+    def update(self, new_state, /):
+        # Positional-only and no *args repacking: this runs on every
+        # settings notify. The type check compiles out under python -O.
+        if __debug__ and type(new_state) is not Settings:
             raise ValueError("Expected state type for settings.")
-        self._value = copy.deepcopy(new_state)
+        # Keep a reference instead of a deepcopy: observers only read the
+        # settings, and SettingsWindow edits its own copy and publishes a
+        # fresh Settings object on save.
+        self._value = new_state
 
     @property
     def value(self):
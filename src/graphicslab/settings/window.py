@@ -1,6 +1,8 @@
 import dataclasses
+import functools
+import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Callable
-import copy
 
 from imgui_bundle import imgui, imgui_ctx
 
@@ -10,6 +12,67 @@ from graphicslab.settings.settings import Settings, SettingsState
 from graphicslab.settings.utils import save_settings
 
 
+logger = logging.getLogger(__name__)
+
+
+FIELDS_CACHE: dict[type, tuple] = {}
+
+# Constant window flags, resolved once instead of per frame.
+SETTINGS_WINDOW_FLAGS = imgui.WindowFlags_.menu_bar.value
+
+# Single worker pool for settings JSON serialization + file write, so the
+# Save click doesn't stall the render loop. One worker keeps saves ordered.
+io_pool = ThreadPoolExecutor(max_workers=1)
+
+
+def log_save_error(future: Future):
+    """Surface a failed config write, which the pool would otherwise drop."""
+    err = future.exception()
+    if err is not None:
+        logger.error(f"Failed to save settings: {err}")
+
+
+def dataclass_fields(obj):
+    """Cached dataclasses.fields, which rebuilds a tuple on every call."""
+    cls = type(obj)
+    fields = FIELDS_CACHE.get(cls)
+    if fields is None:
+        fields = dataclasses.fields(obj)
+        FIELDS_CACHE[cls] = fields
+    return fields
+
+
+def clone_settings(settings: Settings) -> Settings:
+    """Field-level clone of Settings, cheaper than a generic deepcopy.
+
+    Only SettingsField values are mutated by the UI, so each tab is
+    rebuilt with fresh SettingsField copies and every other field is
+    shared. Skips deepcopy's memo dict and per-object type dispatch.
+
+    Args:
+        settings: settings to clone.
+
+    Returns:
+        A clone sharing no SettingsField objects with the original.
+    """
+    tabs = {}
+    for tab_field in dataclass_fields(settings):
+        tab = getattr(settings, tab_field.name)
+        replaced = {}
+        for field in dataclass_fields(tab):
+            value = getattr(tab, field.name)
+            if type(value) is SettingsField:
+                replaced[field.name] = dataclasses.replace(value)
+        tabs[tab_field.name] = dataclasses.replace(tab, **replaced)
+    return dataclasses.replace(settings, **tabs)
+
+
+@functools.lru_cache(maxsize=None)
+def text_width(text: str) -> float:
+    """Measure static text once instead of re-measuring it every frame."""
+    return imgui.calc_text_size(text).x
+
+
 def render_int_field(field: SettingsField[int]):
     if field.style == FieldStyle.INPUT:
         changed, field.value = imgui.input_int(
@@ -77,21 +140,19 @@ def render_bool_field(field: SettingsField[bool]):
     return changed
 
 
+# Field renderer dispatch by value type.
+# TODO: str field rendering.
+FIELD_RENDERERS = {
+    int: render_int_field,
+    float: render_float_field,
+    bool: render_bool_field,
+}
+
+
 def render_settings_field(field: SettingsField):
-    changed = False
     # Render field.
-    if type(field.value) is int:
-        changed = render_int_field(field)
-    elif type(field.value) is float:
-        changed = render_float_field(field)
-    elif type(field.value) is bool:
-        changed = render_bool_field(field)
-    elif type(field.value) is str:
-        # TODO: str field rendering.
-        pass
-    else:
-        # Unsupported field type.
-        pass
+    renderer = FIELD_RENDERERS.get(type(field.value))
+    changed = renderer(field) if renderer is not None else False
     # Render help message.
     if field.tooltip != "":
         imgui.set_item_tooltip(field.tooltip)
@@ -106,24 +167,31 @@ class SettingsWindow(Window):
     def __init__(self, close_window: Callable[[], None], settings: SettingsState):
         super().__init__(close_window)
         self.settings_state = settings
-        self.unsaved_settings = copy.deepcopy(settings.value)
+        self.unsaved_settings = clone_settings(settings.value)
 
     def render(self, time: float, frame_time: float):
         imgui.set_next_window_size_constraints(
             (400, 200),
             (imgui.FLT_MAX, imgui.FLT_MAX)
         )
-        window_flags = imgui.WindowFlags_.menu_bar.value
-        with imgui_ctx.begin("Settings", True, window_flags) as (expanded, opened):
+        with imgui_ctx.begin("Settings", True, SETTINGS_WINDOW_FLAGS) as (expanded, opened):
             if not opened:
                 self.close_window()
+            # Collapsed: ImGui draws nothing, so skip submitting the menu
+            # bar and all settings widgets.
+            if not expanded:
+                return
 
             with imgui_ctx.begin_menu_bar():
                 clicked, _ = imgui.menu_item("Save", "", False, self.unsave)
                 if clicked:
                     self.settings_state.value = self.unsaved_settings
-                    save_settings(self.unsaved_settings)
-                    self.unsaved_settings = copy.deepcopy(
+                    # The window keeps editing a fresh copy, so the published
+                    # settings can be serialized off the UI thread safely.
+                    io_pool.submit(
+                        save_settings, self.unsaved_settings
+                    ).add_done_callback(log_save_error)
+                    self.unsaved_settings = clone_settings(
                         self.unsaved_settings)
                     self.unsave = False
 
@@ -138,18 +206,17 @@ class SettingsWindow(Window):
 
             imgui_style = imgui.get_style()
             with imgui_ctx.begin_tab_bar("##settings_tab", imgui.TableFlags_.none.value):
-                for tab_field in dataclasses.fields(self.unsaved_settings):
+                for tab_field in dataclass_fields(self.unsaved_settings):
                     tab_field = getattr(self.unsaved_settings, tab_field.name)
                     tab_name = tab_field.disp_name
                     if imgui.begin_tab_item(tab_name)[0]:
-                        for settings_field in dataclasses.fields(tab_field):
+                        for settings_field in dataclass_fields(tab_field):
                             settings_field = getattr(
                                 tab_field, settings_field.name)
                             if type(settings_field) is SettingsField:
-                                text_width = imgui.calc_text_size(
-                                    settings_field.disp_name).x
-                                imgui.push_item_width(-text_width -
-                                                      imgui_style.frame_padding.x)
+                                imgui.push_item_width(
+                                    -text_width(settings_field.disp_name) -
+                                    imgui_style.frame_padding.x)
                                 if render_settings_field(settings_field):
                                     self.unsave = True
                                 imgui.pop_item_width()